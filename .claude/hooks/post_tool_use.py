@@ -9,10 +9,7 @@
 import json
 import os
 import sys
-import subprocess
-import random
 from pathlib import Path
-from datetime import datetime
 from utils.constants import ensure_session_log_dir
 
 try:
@@ -25,35 +22,6 @@ except ImportError:
     pass  # dotenv is optional
 
 
-def get_tts_script_path():
-    """
-    Determine which TTS script to use based on available API keys.
-    Priority order: ElevenLabs > OpenAI > pyttsx3
-    """
-    # Get current script directory and construct utils/tts path
-    script_dir = Path(__file__).parent
-    tts_dir = script_dir / "utils" / "tts"
-    
-    # Check for ElevenLabs API key (highest priority)
-    if os.getenv('ELEVENLABS_API_KEY'):
-        elevenlabs_script = tts_dir / "elevenlabs_tts.py"
-        if elevenlabs_script.exists():
-            return str(elevenlabs_script)
-    
-    # Check for OpenAI API key (second priority)
-    if os.getenv('OPENAI_API_KEY'):
-        openai_script = tts_dir / "openai_tts.py"
-        if openai_script.exists():
-            return str(openai_script)
-    
-    # Fall back to pyttsx3 (no API key required)
-    pyttsx3_script = tts_dir / "pyttsx3_tts.py"
-    if pyttsx3_script.exists():
-        return str(pyttsx3_script)
-    
-    return None
-
-
 def get_completion_messages():
     """Return list of friendly task completion messages."""
     return [
@@ -95,8 +63,15 @@ def is_task_completion(input_data):
 
 def announce_task_completion():
     """Announce task completion using the best available TTS service."""
+    # Only needed when announcing, so keep them off the default path
+    import random
+    import subprocess
+    
     try:
-        tts_script = get_tts_script_path()
+        # Imported here so the backend is resolved after .env is loaded
+        from utils.tts_resolver import TTS_SCRIPT, play_tts_in_process
+        
+        tts_script = TTS_SCRIPT
         if not tts_script:
             return  # No TTS scripts available
         
@@ -104,15 +79,21 @@ def announce_task_completion():
         completion_messages = get_completion_messages()
         message = random.choice(completion_messages)
         
-        # Call the TTS script with the completion message
-        subprocess.run([
+        # Speak in-process for ElevenLabs to skip uv and interpreter startup
+        if play_tts_in_process(tts_script, message):
+            return
+        
+        # Start the TTS script in the background with the completion message
+        subprocess.Popen([
             "uv", "run", tts_script, message
-        ], 
-        capture_output=True,  # Suppress output
-        timeout=10  # 10-second timeout
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True  # Don't block the hook waiting on playback
         )
         
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
+    except (subprocess.SubprocessError, FileNotFoundError):
         # Fail silently if TTS encounters issues
         pass
     except Exception:
@@ -136,40 +117,22 @@ def main():
         
         # Ensure session log directory exists
         log_dir = ensure_session_log_dir(session_id)
-        log_path = log_dir / 'post_tool_use.json'
-        
-        # Read existing log data or initialize empty list
-        if log_path.exists():
-            with open(log_path, 'r') as f:
-                try:
-                    log_data = json.load(f)
-                except (json.JSONDecodeError, ValueError):
-                    log_data = []
-        else:
-            log_data = []
-        
-        # Append new data
-        log_data.append(input_data)
+        log_path = log_dir / 'post_tool_use.jsonl'
         
-        # Write back to file with formatting
-        with open(log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        # Append new data as a single JSON line
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(input_data, separators=(',', ':')) + '\n')
         
-        # Create a debug file to confirm hook is running  
-        debug_file = Path(__file__).parent / "debug_post_tool_use.txt"
-        debug_file.write_text(f"PostToolUse hook ran at {datetime.now()}\n")
+        # Create a debug file to confirm hook is running (opt-in)
+        if os.getenv('DEBUG_POST_TOOL_USE'):
+            from datetime import datetime
+            debug_file = Path(__file__).parent / "debug_post_tool_use.txt"
+            debug_file.write_text(f"PostToolUse hook ran at {datetime.now()}\n")
 
         # Announce completion after every tool use (only if --notify flag is set)
         if args.notify:
             # Always announce, not just for completed tasks
-            try:
-                tts_script = get_tts_script_path()
-                if tts_script:
-                    messages = get_completion_messages()
-                    message = random.choice(messages)
-                    subprocess.run(["uv", "run", tts_script, message], timeout=10)
-            except Exception:
-                pass
+            announce_task_completion()
         
         sys.exit(0)
         
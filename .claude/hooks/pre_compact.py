@@ -32,21 +32,18 @@ def log_pre_compact(input_data):
     log_file = log_dir / 'pre_compact.json'
     
     # Read existing log data or initialize empty list
-    if log_file.exists():
+    try:
         with open(log_file, 'r') as f:
-            try:
-                log_data = json.load(f)
-            except (json.JSONDecodeError, ValueError):
-                log_data = []
-    else:
+            log_data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, ValueError):
         log_data = []
     
     # Append the entire input data
     log_data.append(input_data)
     
-    # Write back to file with formatting
+    # Write back to file in compact form (pretty-print with `python -m json.tool`)
     with open(log_file, 'w') as f:
-        json.dump(log_data, f, indent=2)
+        json.dump(log_data, f, separators=(',', ':'))
 
 
 def backup_transcript(transcript_path, trigger):
@@ -74,39 +71,13 @@ def backup_transcript(transcript_path, trigger):
         return None
 
 
-def get_tts_script_path():
-    """
-    Determine which TTS script to use based on available API keys.
-    Priority order: ElevenLabs > OpenAI > pyttsx3
-    """
-    # Get current script directory and construct utils/tts path
-    script_dir = Path(__file__).parent
-    tts_dir = script_dir / "utils" / "tts"
-    
-    # Check for ElevenLabs API key (highest priority)
-    if os.getenv('ELEVENLABS_API_KEY'):
-        elevenlabs_script = tts_dir / "elevenlabs_tts.py"
-        if elevenlabs_script.exists():
-            return str(elevenlabs_script)
-    
-    # Check for OpenAI API key (second priority)
-    if os.getenv('OPENAI_API_KEY'):
-        openai_script = tts_dir / "openai_tts.py"
-        if openai_script.exists():
-            return str(openai_script)
-    
-    # Fall back to pyttsx3 (no API key required)
-    pyttsx3_script = tts_dir / "pyttsx3_tts.py"
-    if pyttsx3_script.exists():
-        return str(pyttsx3_script)
-    
-    return None
-
-
 def announce_pre_compact():
     """Announce pre-compact event using TTS."""
     try:
-        tts_script = get_tts_script_path()
+        # Imported here so the backend is resolved after .env is loaded
+        from utils.tts_resolver import TTS_SCRIPT
+        
+        tts_script = TTS_SCRIPT
         if not tts_script:
             return  # No TTS scripts available
         
@@ -141,7 +112,7 @@ def main():
         args = parser.parse_args()
         
         # Read JSON input from stdin
-        input_data = json.loads(sys.stdin.read())
+        input_data = json.load(sys.stdin)
         
         # Extract fields
         session_id = input_data.get('session_id', 'unknown')
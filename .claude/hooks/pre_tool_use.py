@@ -9,8 +9,6 @@
 import json
 import sys
 import re
-import subprocess
-import os
 from pathlib import Path
 from utils.constants import ensure_session_log_dir
 
@@ -23,84 +21,60 @@ try:
 except ImportError:
     pass  # dotenv is optional
 
+# Only the most dangerous rm -rf patterns on critical system paths, fused into
+# a single case-insensitive pattern compiled once at import time. The pattern
+# tolerates any run of whitespace itself, so commands are matched as-is:
+#   rm -rf /            (root only)
+#   rm -rf /*           (root contents only)
+#   rm -rf /usr, /etc, /boot, /sys, /proc  (optionally with trailing / or /*)
+_DANGEROUS_RM = re.compile(
+    r'\brm\s+(?:-[rf]+|-r\s+-f|-f\s+-r|--recursive\s+--force|--force\s+--recursive)'
+    r'\s+/(?:(?:usr|etc|boot|sys|proc)(?:/\*?)?|\*)?\s*$',
+    re.IGNORECASE
+)
+
+
 def is_dangerous_rm_command(command):
     """
     Detection of only the most dangerous rm commands.
     Focus on system-critical paths to prevent catastrophic damage.
     """
-    # Normalize command by removing extra spaces and converting to lowercase
-    normalized = ' '.join(command.lower().split())
-    
-    # Only check for the most dangerous rm -rf patterns on critical system paths
-    # Use more precise patterns to avoid false positives
-    critical_system_patterns = [
-        r'\brm\s+(-[rf]+|-r\s+-f|-f\s+-r|--recursive\s+--force|--force\s+--recursive)\s+/$',              # rm -rf / (root only)
-        r'\brm\s+(-[rf]+|-r\s+-f|-f\s+-r|--recursive\s+--force|--force\s+--recursive)\s+/\*$',             # rm -rf /* (root contents only) 
-        r'\brm\s+(-[rf]+|-r\s+-f|-f\s+-r|--recursive\s+--force|--force\s+--recursive)\s+/usr(/\*?)?$',     # rm -rf /usr or /usr/*
-        r'\brm\s+(-[rf]+|-r\s+-f|-f\s+-r|--recursive\s+--force|--force\s+--recursive)\s+/etc(/\*?)?$',     # rm -rf /etc or /etc/*
-        r'\brm\s+(-[rf]+|-r\s+-f|-f\s+-r|--recursive\s+--force|--force\s+--recursive)\s+/boot(/\*?)?$',    # rm -rf /boot or /boot/*
-        r'\brm\s+(-[rf]+|-r\s+-f|-f\s+-r|--recursive\s+--force|--force\s+--recursive)\s+/sys(/\*?)?$',     # rm -rf /sys or /sys/*
-        r'\brm\s+(-[rf]+|-r\s+-f|-f\s+-r|--recursive\s+--force|--force\s+--recursive)\s+/proc(/\*?)?$',    # rm -rf /proc or /proc/*
-    ]
-    
-    # Only block the most critical system-destroying commands
-    for pattern in critical_system_patterns:
-        if re.search(pattern, normalized):
-            return True
-    
-    return False
+    return bool(_DANGEROUS_RM.search(command))
 
 # File access restrictions have been completely removed
 # The hook now only blocks the most dangerous system-destroying commands
 
 
-def get_tts_script_path():
-    """
-    Determine which TTS script to use based on available API keys.
-    Priority order: ElevenLabs > OpenAI > pyttsx3
-    """
-    # Get current script directory and construct utils/tts path
-    script_dir = Path(__file__).parent
-    tts_dir = script_dir / "utils" / "tts"
-    
-    # Check for ElevenLabs API key (highest priority)
-    if os.getenv('ELEVENLABS_API_KEY'):
-        elevenlabs_script = tts_dir / "elevenlabs_tts.py"
-        if elevenlabs_script.exists():
-            return str(elevenlabs_script)
-    
-    # Check for OpenAI API key (second priority)
-    if os.getenv('OPENAI_API_KEY'):
-        openai_script = tts_dir / "openai_tts.py"
-        if openai_script.exists():
-            return str(openai_script)
-    
-    # Fall back to pyttsx3 (no API key required)
-    pyttsx3_script = tts_dir / "pyttsx3_tts.py"
-    if pyttsx3_script.exists():
-        return str(pyttsx3_script)
-    
-    return None
-
-
 def announce_pre_tool_use():
     """Announce pre-tool use event using TTS."""
+    # Only needed when announcing, so keep it off the default path
+    import subprocess
+    
     try:
-        tts_script = get_tts_script_path()
+        # Imported here so the backend is resolved after .env is loaded
+        from utils.tts_resolver import TTS_SCRIPT, play_tts_in_process
+        
+        tts_script = TTS_SCRIPT
         if not tts_script:
             return  # No TTS scripts available
         
         message = "Processing tool request"
         
-        # Call the TTS script
-        subprocess.run([
+        # Speak in-process for ElevenLabs to skip uv and interpreter startup
+        if play_tts_in_process(tts_script, message):
+            return
+        
+        # Start the TTS script in the background
+        subprocess.Popen([
             "uv", "run", tts_script, message
-        ], 
-        capture_output=True,  # Suppress output
-        timeout=10  # 10-second timeout
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True  # Don't block the hook waiting on playback
         )
         
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
+    except (subprocess.SubprocessError, FileNotFoundError):
         # Fail silently if TTS encounters issues
         pass
     except Exception:
@@ -137,24 +111,11 @@ def main():
         
         # Ensure session log directory exists
         log_dir = ensure_session_log_dir(session_id)
-        log_path = log_dir / 'pre_tool_use.json'
-        
-        # Read existing log data or initialize empty list
-        if log_path.exists():
-            with open(log_path, 'r') as f:
-                try:
-                    log_data = json.load(f)
-                except (json.JSONDecodeError, ValueError):
-                    log_data = []
-        else:
-            log_data = []
-        
-        # Append new data
-        log_data.append(input_data)
+        log_path = log_dir / 'pre_tool_use.jsonl'
         
-        # Write back to file with formatting
-        with open(log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        # Append new data as a single JSON line
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(input_data, separators=(',', ':')) + '\n')
         
         # Announce pre-tool use via TTS only if --notify flag is set
         if args.notify:
@@ -8,11 +8,12 @@
 
 import argparse
 import json
-import os
+import shutil
 import sys
 import subprocess
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from utils.constants import ensure_session_log_dir
 
 try:
@@ -29,50 +30,35 @@ def log_session_start(session_id, input_data):
     """Log session start event to session directory."""
     # Ensure session log directory exists
     log_dir = ensure_session_log_dir(session_id)
-    log_file = log_dir / 'session_start.json'
+    log_file = log_dir / 'session_start.jsonl'
     
-    # Read existing log data or initialize empty list
-    if log_file.exists():
-        with open(log_file, 'r') as f:
-            try:
-                log_data = json.load(f)
-            except (json.JSONDecodeError, ValueError):
-                log_data = []
-    else:
-        log_data = []
-    
-    # Append the entire input data
-    log_data.append(input_data)
-    
-    # Write back to file with formatting
-    with open(log_file, 'w') as f:
-        json.dump(log_data, f, indent=2)
+    # Append the entire input data as a single JSON line
+    with open(log_file, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(input_data, separators=(',', ':')) + '\n')
 
 
 def get_git_status():
     """Get current git status information."""
     try:
-        # Get current branch
-        branch_result = subprocess.run(
-            ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        current_branch = branch_result.stdout.strip() if branch_result.returncode == 0 else "unknown"
-        
-        # Get uncommitted changes count
+        # Get current branch and uncommitted changes in a single git call
         status_result = subprocess.run(
-            ['git', 'status', '--porcelain'],
+            ['git', 'status', '--porcelain=v2', '--branch'],
             capture_output=True,
             text=True,
             timeout=5
         )
-        if status_result.returncode == 0:
-            changes = status_result.stdout.strip().split('\n') if status_result.stdout.strip() else []
-            uncommitted_count = len(changes)
-        else:
-            uncommitted_count = 0
+        if status_result.returncode != 0:
+            return "unknown", 0
+        
+        current_branch = "unknown"
+        uncommitted_count = 0
+        for line in status_result.stdout.splitlines():
+            if line.startswith('# branch.head '):
+                current_branch = line[len('# branch.head '):].strip()
+                if current_branch == '(detached)':
+                    current_branch = "HEAD"  # Match `git rev-parse --abbrev-ref HEAD`
+            elif line and not line.startswith('#'):
+                uncommitted_count += 1
         
         return current_branch, uncommitted_count
     except Exception:
@@ -83,8 +69,7 @@ def get_recent_issues():
     """Get recent GitHub issues if gh CLI is available."""
     try:
         # Check if gh is available
-        gh_check = subprocess.run(['which', 'gh'], capture_output=True)
-        if gh_check.returncode != 0:
+        if shutil.which('gh') is None:
             return None
         
         # Get recent open issues
@@ -101,6 +86,24 @@ def get_recent_issues():
     return None
 
 
+def read_context_file(file_path):
+    """Read a project context file, returning None if it's missing or empty."""
+    try:
+        with open(file_path, 'r') as f:
+            # Skip leading whitespace a chunk at a time
+            content = f.read(1024)
+            while content and not content.strip():
+                content = f.read(1024)
+            content = content.lstrip()
+            
+            # Only the first 1000 chars are used, so don't read the whole file
+            if len(content) < 1000:
+                content += f.read(1000 - len(content))
+            return content[:1000].rstrip() or None
+    except Exception:
+        return None  # Missing or unreadable context file
+
+
 def load_development_context(source):
     """Load relevant development context based on session source."""
     context_parts = []
@@ -109,13 +112,6 @@ def load_development_context(source):
     context_parts.append(f"Session started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     context_parts.append(f"Session source: {source}")
     
-    # Add git information
-    branch, changes = get_git_status()
-    if branch:
-        context_parts.append(f"Git branch: {branch}")
-        if changes > 0:
-            context_parts.append(f"Uncommitted changes: {changes} files")
-    
     # Load project-specific context files if they exist
     context_files = [
         ".claude/CONTEXT.md",
@@ -124,19 +120,32 @@ def load_development_context(source):
         ".github/ISSUE_TEMPLATE.md"
     ]
     
-    for file_path in context_files:
-        if Path(file_path).exists():
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read().strip()
-                    if content:
-                        context_parts.append(f"\n--- Content from {file_path} ---")
-                        context_parts.append(content[:1000])  # Limit to first 1000 chars
-            except Exception:
-                pass
+    # Run the git, gh and file lookups concurrently - they are all blocking I/O.
+    # Leaving the block waits for every lookup; the git (5s) and gh (10s)
+    # subprocess timeouts are what bound that wait.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        git_future = executor.submit(get_git_status)
+        issues_future = executor.submit(get_recent_issues)
+        file_futures = [
+            (file_path, executor.submit(read_context_file, file_path))
+            for file_path in context_files
+        ]
+    
+    # Add git information
+    branch, changes = git_future.result()
+    if branch:
+        context_parts.append(f"Git branch: {branch}")
+        if changes > 0:
+            context_parts.append(f"Uncommitted changes: {changes} files")
+    
+    for file_path, future in file_futures:
+        content = future.result()
+        if content:
+            context_parts.append(f"\n--- Content from {file_path} ---")
+            context_parts.append(content[:1000])  # Limit to first 1000 chars
     
     # Add recent issues if available
-    issues = get_recent_issues()
+    issues = issues_future.result()
     if issues:
         context_parts.append("\n--- Recent GitHub Issues ---")
         context_parts.append(issues)
@@ -144,39 +153,13 @@ def load_development_context(source):
     return "\n".join(context_parts)
 
 
-def get_tts_script_path():
-    """
-    Determine which TTS script to use based on available API keys.
-    Priority order: ElevenLabs > OpenAI > pyttsx3
-    """
-    # Get current script directory and construct utils/tts path
-    script_dir = Path(__file__).parent
-    tts_dir = script_dir / "utils" / "tts"
-    
-    # Check for ElevenLabs API key (highest priority)
-    if os.getenv('ELEVENLABS_API_KEY'):
-        elevenlabs_script = tts_dir / "elevenlabs_tts.py"
-        if elevenlabs_script.exists():
-            return str(elevenlabs_script)
-    
-    # Check for OpenAI API key (second priority)
-    if os.getenv('OPENAI_API_KEY'):
-        openai_script = tts_dir / "openai_tts.py"
-        if openai_script.exists():
-            return str(openai_script)
-    
-    # Fall back to pyttsx3 (no API key required)
-    pyttsx3_script = tts_dir / "pyttsx3_tts.py"
-    if pyttsx3_script.exists():
-        return str(pyttsx3_script)
-    
-    return None
-
-
 def announce_session_start(source):
     """Announce session start using TTS."""
     try:
-        tts_script = get_tts_script_path()
+        # Imported here so the backend is resolved after .env is loaded
+        from utils.tts_resolver import TTS_SCRIPT, play_tts_in_process
+        
+        tts_script = TTS_SCRIPT
         if not tts_script:
             return  # No TTS scripts available
         
@@ -188,15 +171,21 @@ def announce_session_start(source):
         }
         message = messages.get(source, "Session started")
         
-        # Call the TTS script
-        subprocess.run([
+        # Speak in-process for ElevenLabs to skip uv and interpreter startup
+        if play_tts_in_process(tts_script, message):
+            return
+        
+        # Start the TTS script in the background
+        subprocess.Popen([
             "uv", "run", tts_script, message
-        ], 
-        capture_output=True,  # Suppress output
-        timeout=10  # 10-second timeout
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True  # Don't block the hook waiting on playback
         )
         
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
+    except (subprocess.SubprocessError, FileNotFoundError):
         # Fail silently if TTS encounters issues
         pass
     except Exception:
@@ -215,7 +204,7 @@ def main():
         args = parser.parse_args()
         
         # Read JSON input from stdin
-        input_data = json.loads(sys.stdin.read())
+        input_data = json.load(sys.stdin)
         
         # Extract fields
         session_id = input_data.get('session_id', 'unknown')
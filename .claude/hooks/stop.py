@@ -37,35 +37,6 @@ def get_completion_messages():
     ]
 
 
-def get_tts_script_path():
-    """
-    Determine which TTS script to use based on available API keys.
-    Priority order: ElevenLabs > OpenAI > pyttsx3
-    """
-    # Get current script directory and construct utils/tts path
-    script_dir = Path(__file__).parent
-    tts_dir = script_dir / "utils" / "tts"
-
-    # Check for ElevenLabs API key (highest priority)
-    if os.getenv("ELEVENLABS_API_KEY"):
-        elevenlabs_script = tts_dir / "elevenlabs_tts.py"
-        if elevenlabs_script.exists():
-            return str(elevenlabs_script)
-
-    # Check for OpenAI API key (second priority)
-    if os.getenv("OPENAI_API_KEY"):
-        openai_script = tts_dir / "openai_tts.py"
-        if openai_script.exists():
-            return str(openai_script)
-
-    # Fall back to pyttsx3 (no API key required)
-    pyttsx3_script = tts_dir / "pyttsx3_tts.py"
-    if pyttsx3_script.exists():
-        return str(pyttsx3_script)
-
-    return None
-
-
 def get_llm_completion_message():
     """
     Generate completion message using available LLM services.
@@ -81,7 +52,7 @@ def get_llm_completion_message():
     # Try OpenAI first (highest priority)
     if os.getenv("OPENAI_API_KEY"):
         oai_script = llm_dir / "oai.py"
-        if oai_script.exists():
+        if os.path.isfile(oai_script):
             try:
                 result = subprocess.run(
                     ["uv", "run", str(oai_script), "--completion"],
@@ -97,7 +68,7 @@ def get_llm_completion_message():
     # Try Anthropic second
     if os.getenv("ANTHROPIC_API_KEY"):
         anth_script = llm_dir / "anth.py"
-        if anth_script.exists():
+        if os.path.isfile(anth_script):
             try:
                 result = subprocess.run(
                     ["uv", "run", str(anth_script), "--completion"],
@@ -126,7 +97,10 @@ def announce_completion():
         except ImportError:
             pass
             
-        tts_script = get_tts_script_path()
+        # Imported here so the backend is resolved after .env is loaded
+        from utils.tts_resolver import TTS_SCRIPT
+
+        tts_script = TTS_SCRIPT
         if not tts_script:
             return  # No TTS scripts available
 
@@ -177,21 +151,18 @@ def main():
         log_path = log_dir / "stop.json"
 
         # Read existing log data or initialize empty list
-        if log_path.exists():
+        try:
             with open(log_path, "r") as f:
-                try:
-                    log_data = json.load(f)
-                except (json.JSONDecodeError, ValueError):
-                    log_data = []
-        else:
+                log_data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, ValueError):
             log_data = []
 
         # Append new data
         log_data.append(input_data)
 
-        # Write back to file with formatting
+        # Write back to file in compact form (pretty-print with `python -m json.tool`)
         with open(log_path, "w") as f:
-            json.dump(log_data, f, indent=2)
+            json.dump(log_data, f, separators=(",", ":"))
 
         # Handle --chat switch
         if args.chat and "transcript_path" in input_data:
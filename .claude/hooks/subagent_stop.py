@@ -11,7 +11,6 @@ import json
 import os
 import sys
 import subprocess
-from pathlib import Path
 from datetime import datetime
 from utils.constants import ensure_session_log_dir
 
@@ -22,39 +21,13 @@ except ImportError:
     pass  # dotenv is optional
 
 
-def get_tts_script_path():
-    """
-    Determine which TTS script to use based on available API keys.
-    Priority order: ElevenLabs > OpenAI > pyttsx3
-    """
-    # Get current script directory and construct utils/tts path
-    script_dir = Path(__file__).parent
-    tts_dir = script_dir / "utils" / "tts"
-    
-    # Check for ElevenLabs API key (highest priority)
-    if os.getenv('ELEVENLABS_API_KEY'):
-        elevenlabs_script = tts_dir / "elevenlabs_tts.py"
-        if elevenlabs_script.exists():
-            return str(elevenlabs_script)
-    
-    # Check for OpenAI API key (second priority)
-    if os.getenv('OPENAI_API_KEY'):
-        openai_script = tts_dir / "openai_tts.py"
-        if openai_script.exists():
-            return str(openai_script)
-    
-    # Fall back to pyttsx3 (no API key required)
-    pyttsx3_script = tts_dir / "pyttsx3_tts.py"
-    if pyttsx3_script.exists():
-        return str(pyttsx3_script)
-    
-    return None
-
-
 def announce_subagent_completion():
     """Announce subagent completion using the best available TTS service."""
     try:
-        tts_script = get_tts_script_path()
+        # Imported here so the backend is resolved after .env is loaded
+        from utils.tts_resolver import TTS_SCRIPT
+        
+        tts_script = TTS_SCRIPT
         if not tts_script:
             return  # No TTS scripts available
         
@@ -96,21 +69,18 @@ def main():
         log_path = log_dir / "subagent_stop.json"
 
         # Read existing log data or initialize empty list
-        if log_path.exists():
+        try:
             with open(log_path, 'r') as f:
-                try:
-                    log_data = json.load(f)
-                except (json.JSONDecodeError, ValueError):
-                    log_data = []
-        else:
+                log_data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, ValueError):
             log_data = []
         
         # Append new data
         log_data.append(input_data)
         
-        # Write back to file with formatting
+        # Write back to file in compact form (pretty-print with `python -m json.tool`)
         with open(log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+            json.dump(log_data, f, separators=(',', ':'))
         
         # Handle --chat switch (same as stop.py)
         if args.chat and 'transcript_path' in input_data:
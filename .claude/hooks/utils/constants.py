@@ -7,6 +7,7 @@
 Constants for Claude Code Hooks.
 """
 
+import json
 import os
 from pathlib import Path
 
@@ -45,4 +46,26 @@ def ensure_session_log_dir(session_id: str) -> Path:
     """
     log_dir = get_session_log_dir(session_id)
     log_dir.mkdir(parents=True, exist_ok=True)
-    return log_dir
\ No newline at end of file
+    return log_dir
+
+def read_jsonl_log(log_file: Path):
+    """
+    Stream entries from a newline-delimited JSON log file.
+    
+    Args:
+        log_file: Path to a .jsonl log written by one of the hooks
+        
+    Yields:
+        Each decoded log entry, skipping blank or invalid lines
+    """
+    try:
+        with open(log_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        pass  # Skip invalid lines
+    except FileNotFoundError:
+        return
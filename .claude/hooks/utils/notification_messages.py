@@ -0,0 +1,135 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.8"
+# ///
+
+"""
+Context-aware TTS messages for the Notification hook.
+
+Only imported when the hook runs with --notify, after .env has been loaded.
+Keyword matching needs pyahocorasick, which notification.py declares in its
+script dependencies.
+"""
+
+import os
+import random
+import sys
+
+import ahocorasick
+
+
+# Notification keywords grouped by category, in priority order
+NOTIFICATION_INDICATORS = {
+    'user_input': [
+        'input', 'decision', 'choose', 'select', 'confirm', 'approve',
+        'would you like', 'do you want', 'please', 'permission',
+        'continue?', 'proceed?', 'yes/no', 'y/n'
+    ],
+    'error': ['error', 'warning', 'failed'],
+    'completion': ['complete', 'finished', 'done', 'success'],
+}
+
+# TTS messages for each category, formatted once with the engineer's name
+ENGINEER_NAME = os.getenv('ENGINEER_NAME', '').strip()
+NAME_PREFIX = f"{ENGINEER_NAME}, " if ENGINEER_NAME else ""
+
+USER_INPUT_MESSAGES = tuple(f"{NAME_PREFIX}{m}" for m in (
+    "Your input is needed",
+    "Claude needs your decision",
+    "Please check Claude",
+    "User input required",
+))
+ERROR_MESSAGES = tuple(f"{NAME_PREFIX}{m}" for m in (
+    "Error occurred, check Claude",
+    "Something needs attention",
+    "Check for issues",
+))
+COMPLETION_MESSAGES = tuple(f"{NAME_PREFIX}{m}" for m in (
+    "Task completed",
+    "Claude is done",
+    "Work finished",
+))
+DEFAULT_MESSAGE = f"{NAME_PREFIX}Notification from Claude"
+
+
+def build_indicator_automaton():
+    """Build a single Aho-Corasick automaton over every notification keyword."""
+    automaton = ahocorasick.Automaton()
+    for category, words in NOTIFICATION_INDICATORS.items():
+        for word in words:
+            automaton.add_word(word, (word, category))
+    automaton.make_automaton()
+    return automaton
+
+
+INDICATOR_AUTOMATON = build_indicator_automaton()
+
+
+def find_indicators(full_text):
+    """
+    Scan text once for notification keywords.
+    
+    Returns a dict mapping each category to the keywords found in the text.
+    Scanning stops early once a user input keyword is seen, since that
+    category always takes priority.
+    """
+    matched = {category: [] for category in NOTIFICATION_INDICATORS}
+    
+    for _, (word, category) in INDICATOR_AUTOMATON.iter(full_text):
+        if word not in matched[category]:
+            matched[category].append(word)
+        if category == 'user_input':
+            break
+    return matched
+
+
+def get_notification_message(notification_data):
+    """
+    Generate an appropriate TTS message based on notification content.
+    """
+    # Extract notification content
+    payload = notification_data.get('payload', {})
+    notification_type = payload.get('type', '')
+    message = payload.get('message', '')
+    title = payload.get('title', '')
+    
+    full_text = f"{title} {message}".lower()
+    
+    # Debug output if enabled
+    if os.getenv('DEBUG_NOTIFICATIONS'):
+        print(f"Analyzing notification text: '{full_text}'", file=sys.stderr)
+    
+    # Scan once for all indicator categories
+    matched = find_indicators(full_text)
+    
+    # Check if this looks like a user input request
+    matched_indicators = matched['user_input']
+    if matched_indicators:
+        selected_message = random.choice(USER_INPUT_MESSAGES)
+        if os.getenv('DEBUG_NOTIFICATIONS'):
+            print(f"Matched user input indicators: {matched_indicators}", file=sys.stderr)
+            print(f"Selected TTS message: '{selected_message}'", file=sys.stderr)
+        return selected_message
+    
+    # Check for error/warning notifications
+    if matched['error']:
+        selected_message = random.choice(ERROR_MESSAGES)
+        if os.getenv('DEBUG_NOTIFICATIONS'):
+            print(f"Matched error/warning indicators", file=sys.stderr)
+            print(f"Selected TTS message: '{selected_message}'", file=sys.stderr)
+        return selected_message
+    
+    # Check for completion/success notifications
+    matched_completion = matched['completion']
+    if matched_completion:
+        selected_message = random.choice(COMPLETION_MESSAGES)
+        if os.getenv('DEBUG_NOTIFICATIONS'):
+            print(f"Matched completion indicators: {matched_completion}", file=sys.stderr)
+            print(f"Selected TTS message: '{selected_message}'", file=sys.stderr)
+        return selected_message
+    
+    # Default message for other notifications
+    default_message = DEFAULT_MESSAGE
+    if os.getenv('DEBUG_NOTIFICATIONS'):
+        print(f"No specific indicators matched, using default TTS message: '{default_message}'", file=sys.stderr)
+    return default_message
@@ -10,36 +10,55 @@
 import os
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Load environment variables from project directory
-project_env = Path(__file__).parent.parent.parent.parent / ".env"
-if project_env.exists():
-    load_dotenv(project_env)
-else:
-    load_dotenv()  # Fallback to current directory
 
-# Get API key from environment
-api_key = os.getenv('ELEVENLABS_API_KEY')
-if not api_key:
-    sys.exit(1)
+def get_api_key():
+    """Load environment variables and return the ElevenLabs API key, if any."""
+    try:
+        from dotenv import load_dotenv
+
+        # Load environment variables from project directory
+        project_env = Path(__file__).parent.parent.parent.parent / ".env"
+        if project_env.exists():
+            load_dotenv(project_env)
+        else:
+            load_dotenv()  # Fallback to current directory
+    except ImportError:
+        pass  # dotenv is optional when imported in-process
+
+    return os.getenv('ELEVENLABS_API_KEY')
+
 
 def play_text(text):
-    """Generate and play text using ElevenLabs with personalized name."""
+    """
+    Generate and play text using ElevenLabs with personalized name.
+
+    Safe to import and call in-process from the hooks. Raises ImportError
+    if the elevenlabs package is not installed so callers can fall back to
+    running this script through uv.
+
+    Returns:
+        bool: True if the audio was generated and played
+    """
+    from elevenlabs.client import ElevenLabs
+    from elevenlabs import play
+
+    # Get API key from environment
+    api_key = get_api_key()
+    if not api_key:
+        return False
+
     try:
-        from elevenlabs.client import ElevenLabs
-        from elevenlabs import play
-        
         # Initialize client
         client = ElevenLabs(api_key=api_key)
-        
+
         # Get engineer name from environment or use default
         engineer_name = os.getenv("ENGINEER_NAME", "Peter")
-        
+
         # Personalize the message
         # personalized_text = f"{text}, {engineer_name}"  # Commented out - remove name from TTS message
         personalized_text = text
-        
+
         # Generate audio with ElevenLabs Turbo v2.5
         audio = client.text_to_speech.convert(
             text=personalized_text,
@@ -47,16 +66,21 @@ def play_text(text):
             model_id="eleven_turbo_v2_5",
             output_format="mp3_44100_128",
         )
-        
+
         # Play the audio directly
         play(audio)
-        
-    except Exception as e:
-        sys.exit(1)
+        return True
+
+    except Exception:
+        return False
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         text = " ".join(sys.argv[1:])
-        play_text(text)
+        try:
+            success = play_text(text)
+        except ImportError:
+            success = False
+        sys.exit(0 if success else 1)
     else:
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
@@ -0,0 +1,88 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.8"
+# ///
+
+"""
+TTS backend selection shared by the Claude Code Hooks.
+
+The backend is resolved once, when this module is first imported, so import
+it after the hook has loaded its .env file.
+"""
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+# Directory holding the TTS backend scripts
+TTS_DIR = Path(__file__).parent / "tts"
+
+
+def _resolve():
+    """
+    Determine which TTS script to use based on available API keys.
+    Priority order: ElevenLabs > OpenAI > pyttsx3
+    """
+    # Check for ElevenLabs API key (highest priority)
+    if os.getenv('ELEVENLABS_API_KEY'):
+        elevenlabs_script = TTS_DIR / "elevenlabs_tts.py"
+        if os.path.isfile(elevenlabs_script):
+            return str(elevenlabs_script)
+
+    # Check for OpenAI API key (second priority)
+    if os.getenv('OPENAI_API_KEY'):
+        openai_script = TTS_DIR / "openai_tts.py"
+        if os.path.isfile(openai_script):
+            return str(openai_script)
+
+    # Fall back to pyttsx3 (no API key required)
+    pyttsx3_script = TTS_DIR / "pyttsx3_tts.py"
+    if os.path.isfile(pyttsx3_script):
+        return str(pyttsx3_script)
+
+    return None
+
+
+# Path to the selected TTS script, or None if no backend is available
+TTS_SCRIPT = _resolve()
+
+
+def play_tts_in_process(tts_script, message):
+    """
+    Speak a message in-process when the ElevenLabs backend is selected.
+
+    Avoids spawning uv and a second Python interpreter for every announcement;
+    playback happens in a forked, detached child. Returns False when the
+    backend is not ElevenLabs or the elevenlabs package is unavailable, so
+    callers can fall back to `uv run`.
+    """
+    tts_path = Path(tts_script)
+    if tts_path.name != "elevenlabs_tts.py" or not hasattr(os, 'fork'):
+        return False
+
+    # Check the package is installed before forking so we can still fall back
+    if importlib.util.find_spec("elevenlabs") is None:
+        return False
+
+    try:
+        tts_dir = str(tts_path.parent)
+        if tts_dir not in sys.path:
+            sys.path.insert(0, tts_dir)
+        from elevenlabs_tts import play_text
+    except ImportError:
+        return False
+
+    # Fork a detached child to play the audio so the hook returns immediately
+    if os.fork() != 0:
+        return True
+
+    try:
+        os.setsid()
+        # Release the hook's stdio so Claude doesn't wait on the child
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        play_text(message)
+    finally:
+        os._exit(0)
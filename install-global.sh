@@ -288,6 +288,8 @@ fi
 print_status $BLUE "🛠️  Downloading utility modules..."
 download_file "$REPO_URL/.claude/hooks/utils/constants.py" utils/constants.py "constants.py"
 download_file "$REPO_URL/.claude/hooks/utils/summarizer.py" utils/summarizer.py "summarizer.py"
+download_file "$REPO_URL/.claude/hooks/utils/tts_resolver.py" utils/tts_resolver.py "tts_resolver.py"
+download_file "$REPO_URL/.claude/hooks/utils/notification_messages.py" utils/notification_messages.py "notification_messages.py"
 
 # Download LLM modules
 print_status $BLUE "🤖 Downloading AI integrations..."